@@ -5,14 +5,21 @@ This module provides functions for launching Claude Code.
 
 import subprocess
 from pathlib import Path
+from typing import Any, Callable
 
 
-def launch_claude_code(worktree_path: Path, feature_request: str) -> int:
+def launch_claude_code(
+    worktree_path: Path,
+    feature_request: str,
+    *,
+    runner: Callable[..., "subprocess.CompletedProcess[Any]"] = subprocess.run,
+) -> int:
     """Launch Claude Code interactively with the /specify command.
 
     Args:
         worktree_path: Path to worktree directory (used as cwd)
         feature_request: Feature request text to pass to /specify
+        runner: Callable used to run the command (defaults to subprocess.run)
 
     Returns:
         Exit code from Claude Code process
@@ -22,7 +29,7 @@ def launch_claude_code(worktree_path: Path, feature_request: str) -> int:
         # The message will prompt Claude to run /specify with the feature request
         initial_message = f"/specify {feature_request}"
 
-        result = subprocess.run(
+        result = runner(
             ["claude", initial_message],
             cwd=str(worktree_path),
             timeout=None  # No timeout - Claude session can be long
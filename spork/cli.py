@@ -11,12 +11,12 @@ import click
 from spork.claude import launch_claude_code
 from spork.data_models import FeatureRequest, WorktreeConfig
 from spork.git_operations import (
+    cancel_git_fetch,
     create_worktree,
-    get_main_branch,
-    get_repo_root,
-    git_fetch,
-    is_git_repository,
     list_all_branches,
+    load_repo_info,
+    start_git_fetch,
+    wait_for_git_fetch,
 )
 from spork.validators import (
     is_claude_code_installed,
@@ -30,7 +30,12 @@ from spork.worktree import get_next_feature_number, sanitize_feature_name
 
 @click.command()
 @click.argument("feature_request", required=True)
-def cli(feature_request: str) -> None:
+@click.option(
+    "--no-fetch",
+    is_flag=True,
+    help="Skip fetching remote branches before picking the feature number."
+)
+def cli(feature_request: str, no_fetch: bool) -> None:
     """spork - Git Worktree Feature Request Tool
 
     Create a new worktree and launch Claude Code for feature specification.
@@ -56,54 +61,56 @@ def cli(feature_request: str) -> None:
         sys.exit(1)
     click.echo("✓ Git found")
 
-    # 2. Check in git repository
-    cwd = Path.cwd()
-    if not is_git_repository(cwd):
+    # 2. Check in git repository (the same lookup yields main branch and branches)
+    repo_info = load_repo_info(Path.cwd())
+    if repo_info is None:
         click.echo("Error: Not in a git repository", err=True)
         click.echo("  Run 'git init' or navigate to an existing repository", err=True)
         sys.exit(1)
+    repo_root, main_branch = repo_info.root, repo_info.main_branch
+    click.echo(f"✓ In git repository: {repo_root}")
 
-    # Get repository root
-    try:
-        repo_root = get_repo_root()
-        click.echo(f"✓ In git repository: {repo_root}")
-    except RuntimeError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-
-    # Get main branch early (needed for Spec Kit validation)
-    try:
-        main_branch = get_main_branch()
-    except RuntimeError as e:
-        click.echo(f"Error: {e}", err=True)
+    # Main branch is needed for Spec Kit validation
+    if main_branch is None:
+        click.echo("Error: neither 'main' nor 'master' branch found", err=True)
         sys.exit(2)
 
-    # 3. Check Spec Kit initialized on main branch
-    spec_kit_validation = is_spec_kit_initialized(repo_root, main_branch)
-    if not spec_kit_validation.passed:
-        click.echo(f"Error: {spec_kit_validation.error_message}", err=True)
-        if spec_kit_validation.suggestion:
-            click.echo(f"  {spec_kit_validation.suggestion}", err=True)
-        sys.exit(1)
-    click.echo(f"✓ Spec Kit initialized on {main_branch} branch")
-
-    # 4. Check Claude Code installed
-    claude_validation = is_claude_code_installed()
-    if not claude_validation.passed:
-        click.echo(f"Error: {claude_validation.error_message}", err=True)
-        if claude_validation.suggestion:
-            click.echo(f"  {claude_validation.suggestion}", err=True)
-        sys.exit(1)
-    click.echo("✓ Claude Code found")
-
-    # 5. Fetch remote branches
-    click.echo("✓ Fetching remote branches...")
-    if not git_fetch():
-        # Warning but not fatal
-        click.echo("  Warning: git fetch failed, continuing without remote updates", err=True)
-
-    # 6. Get all branches and determine next feature number
-    branches = list_all_branches()
+    # Fetch remote branches in the background while validation continues
+    fetch_process = None if no_fetch else start_git_fetch()
+    # Kill the fetch if any check below exits early, so it does not outlive spork
+    try:
+        # 3. Check Spec Kit initialized on main branch
+        spec_kit_validation = is_spec_kit_initialized(repo_root, main_branch)
+        if not spec_kit_validation.passed:
+            click.echo(f"Error: {spec_kit_validation.error_message}", err=True)
+            if spec_kit_validation.suggestion:
+                click.echo(f"  {spec_kit_validation.suggestion}", err=True)
+            sys.exit(1)
+        click.echo(f"✓ Spec Kit initialized on {main_branch} branch")
+
+        # 4. Check Claude Code installed
+        claude_validation = is_claude_code_installed()
+        if not claude_validation.passed:
+            click.echo(f"Error: {claude_validation.error_message}", err=True)
+            if claude_validation.suggestion:
+                click.echo(f"  {claude_validation.suggestion}", err=True)
+            sys.exit(1)
+        click.echo("✓ Claude Code found")
+
+        # 5. Fetch remote branches (needed before numbering the feature)
+        if not no_fetch:
+            click.echo("✓ Fetching remote branches...")
+            if not wait_for_git_fetch(fetch_process):
+                # Warning but not fatal
+                click.echo(
+                    "  Warning: git fetch failed, continuing without remote updates", err=True
+                )
+    finally:
+        cancel_git_fetch(fetch_process)
+
+    # 6. Get all branches and determine next feature number. Without a fetch
+    # the branches from the startup lookup are still current.
+    branches = repo_info.branches if no_fetch else list_all_branches()
     try:
         feature_number = get_next_feature_number(branches)
         click.echo(f"✓ Next feature number: {feature_number.formatted}")
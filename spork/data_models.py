@@ -1,12 +1,15 @@
-"""Pydantic data models for spork CLI tool.
+"""Data models for spork CLI tool.
 
 This module defines all core data structures with validation logic.
+Models holding user-facing input (FeatureRequest, ValidationResult) use
+Pydantic; internal values built by spork itself are plain dataclasses.
 """
 
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class FeatureRequest(BaseModel):
@@ -15,17 +18,10 @@ class FeatureRequest(BaseModel):
     model_config = {"frozen": True}
 
     text: str = Field(..., min_length=1, max_length=500)
-    sanitized_name: str = Field(..., min_length=1, max_length=50)
+    # Only lowercase, hyphens, alphanumeric
+    sanitized_name: str = Field(..., min_length=1, max_length=50, pattern=r"^[a-z0-9-]+$")
     max_length: int = Field(default=50, ge=1, le=100)
 
-    @field_validator("sanitized_name")
-    @classmethod
-    def validate_sanitized_name(cls, v: str) -> str:
-        """Ensure only lowercase, hyphens, alphanumeric."""
-        if not all(c.isalnum() or c == "-" for c in v):
-            raise ValueError("Sanitized name must contain only alphanumeric and hyphens")
-        return v
-
 
 class ValidationResult(BaseModel):
     """Represents the outcome of a single validation check."""
@@ -45,48 +41,59 @@ class ValidationResult(BaseModel):
         return self
 
 
-class GitRepository(BaseModel):
+@dataclass(frozen=True)
+class GitRepository:
     """Represents a git repository and its metadata."""
 
-    model_config = {"frozen": True}
-
     root_path: Path
     current_branch: str
     has_remote: bool
     main_branch: str
 
-    @field_validator("main_branch")
-    @classmethod
-    def validate_main_branch(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         """Ensure main_branch is either 'main' or 'master'."""
-        if v not in ("main", "master"):
+        if self.main_branch not in ("main", "master"):
             raise ValueError("main_branch must be 'main' or 'master'")
-        return v
 
 
-class FeatureNumber(BaseModel):
+@dataclass(frozen=True)
+class GitRepoInfo:
+    """Repository state gathered by a single git lookup at startup."""
+
+    root: Path
+    main_branch: Optional[str]
+    local_branches: tuple[str, ...]
+    remote_branches: tuple[str, ...]
+
+    @property
+    def branches(self) -> list[str]:
+        """Local then remote branch names, as list_all_branches returns them."""
+        return [*self.local_branches, *self.remote_branches]
+
+
+@dataclass(frozen=True)
+class FeatureNumber:
     """Represents the numeric component of a feature branch name."""
 
-    model_config = {"frozen": True}
+    number: int
 
-    number: int = Field(..., ge=1, le=999)
-    formatted: str = Field(..., pattern=r"^\d{3}$")
+    def __post_init__(self) -> None:
+        """Ensure number is within 1..999."""
+        if self.number < 1:
+            raise ValueError("number must be greater than or equal to 1")
+        if self.number > 999:
+            raise ValueError("number must be less than or equal to 999")
 
-    @model_validator(mode="after")
-    def validate_formatted_matches_number(self) -> "FeatureNumber":
-        """Ensure formatted string matches the number."""
-        if self.formatted != f"{self.number:03d}":
-            raise ValueError(
-                f"formatted '{self.formatted}' must match number {self.number:03d}"
-            )
-        return self
+    @property
+    def formatted(self) -> str:
+        """Zero-padded 3-digit form of the number."""
+        return f"{self.number:03d}"
 
 
-class WorktreeConfig(BaseModel):
+@dataclass(frozen=True)
+class WorktreeConfig:
     """Represents the configuration for creating a new worktree."""
 
-    model_config = {"frozen": True}
-
     branch_name: str
     directory_path: Path
     base_branch: str
@@ -94,10 +101,11 @@ class WorktreeConfig(BaseModel):
     feature_request: FeatureRequest
 
 
-class CommandContext(BaseModel):
+@dataclass
+class CommandContext:
     """Represents the execution context for the entire spork command."""
 
     original_cwd: Path
     repository: Optional[GitRepository] = None
     worktree_config: Optional[WorktreeConfig] = None
-    validation_results: list[ValidationResult] = Field(default_factory=list)
+    validation_results: list[ValidationResult] = field(default_factory=list)
@@ -3,27 +3,24 @@
 This module provides functions for interacting with git via subprocess.
 """
 
+import functools
+import os
+import shutil
 import subprocess
 from pathlib import Path
+from typing import Optional
 
+from spork.data_models import GitRepoInfo
 
+
+@functools.lru_cache(maxsize=1)
 def is_git_installed() -> bool:
     """Check if git is installed and accessible.
 
     Returns:
-        True if git --version succeeds, False otherwise
+        True if git is found in PATH, False otherwise
     """
-    try:
-        result = subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    return shutil.which("git") is not None
 
 
 def is_git_repository(path: Path) -> bool:
@@ -38,7 +35,8 @@ def is_git_repository(path: Path) -> bool:
     try:
         result = subprocess.run(
             ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True,
             timeout=5
@@ -48,18 +46,89 @@ def is_git_repository(path: Path) -> bool:
         return False
 
 
-def get_repo_root() -> Path:
+# for-each-ref line format: "<full ref name> <symbolic ref target, if any>"
+_REF_FORMAT = "--format=%(refname) %(symref)"
+
+
+def load_repo_info(path: Path) -> Optional[GitRepoInfo]:
+    """Gather repository root, main branch and branch names.
+
+    Args:
+        path: Path inside the repository
+
+    Returns:
+        GitRepoInfo, or None when path is not inside a work tree
+    """
+    try:
+        toplevel = subprocess.run(
+            ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree", "--show-toplevel"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+            timeout=5
+        )
+        lines = toplevel.stdout.splitlines()
+        if toplevel.returncode != 0 or len(lines) < 2 or lines[0].strip() != "true":
+            return None
+
+        # Full ref names keep a tag sharing a branch's name from hiding the branch
+        refs = subprocess.run(
+            ["git", "-C", str(path), "for-each-ref", _REF_FORMAT, "refs/heads/", "refs/remotes/"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+            timeout=5
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if refs.returncode != 0:
+        return None
+
+    local: list[str] = []
+    remote: list[str] = []
+    for line in refs.stdout.splitlines():
+        refname, _, symref = line.partition(" ")
+        if refname.startswith("refs/heads/"):
+            local.append(refname[len("refs/heads/"):])
+        elif refname.startswith("refs/remotes/") and not symref:
+            # Symbolic refs such as origin/HEAD only repeat another branch
+            remote.append(refname[len("refs/remotes/"):])
+
+    return GitRepoInfo(
+        root=Path(lines[1].strip()),
+        main_branch=next((b for b in ("main", "master") if b in local), None),
+        local_branches=tuple(local),
+        remote_branches=tuple(remote),
+    )
+
+
+def get_repo_root(cwd: Optional[str] = None) -> Path:
     """Get absolute path to repository root.
 
+    Results are cached per working directory, so repeat lookups from the same
+    directory do not spawn git again.
+
+    Args:
+        cwd: Directory to resolve from (defaults to the current directory)
+
     Returns:
         Path object to repo root
 
     Raises:
         RuntimeError: If not in git repo
     """
+    return _repo_root_for(os.getcwd() if cwd is None else cwd)
+
+
+@functools.lru_cache(maxsize=32)
+def _repo_root_for(cwd: str) -> Path:
+    """Resolve and cache the repository root for an explicit directory."""
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
             capture_output=True,
             text=True,
             check=True,
@@ -74,65 +143,116 @@ def get_repo_root() -> Path:
         raise RuntimeError(f"Git operation failed: {e}")
 
 
-def get_main_branch() -> str:
+def get_main_branch(cwd: Optional[str] = None) -> str:
     """Determine main branch name (main or master).
 
+    Results are cached per working directory, so repeat lookups from the same
+    directory do not spawn git again.
+
+    Args:
+        cwd: Directory to resolve from (defaults to the current directory)
+
     Returns:
         "main" or "master"
 
     Raises:
         RuntimeError: If neither exists
     """
-    # Try 'main' first (modern convention)
-    try:
-        subprocess.run(
-            ["git", "rev-parse", "--verify", "main"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5
-        )
-        return "main"
-    except subprocess.CalledProcessError:
-        pass
+    return _main_branch_for(os.getcwd() if cwd is None else cwd)
+
 
-    # Try 'master' (legacy convention)
+@functools.lru_cache(maxsize=32)
+def _main_branch_for(cwd: str) -> str:
+    """Resolve and cache the main branch name for an explicit directory."""
     try:
-        subprocess.run(
-            ["git", "rev-parse", "--verify", "master"],
-            capture_output=True,
+        result = subprocess.run(
+            [
+                "git", "for-each-ref", "--format=%(refname:short)",
+                "refs/heads/main", "refs/heads/master",
+            ],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True,
             timeout=5
         )
-        return "master"
-    except subprocess.CalledProcessError:
-        pass
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        raise RuntimeError("neither 'main' nor 'master' branch found")
+
+    # Prefer 'main' (modern convention) over 'master' (legacy convention)
+    existing = set(result.stdout.split())
+    for candidate in ("main", "master"):
+        if candidate in existing:
+            return candidate
 
     raise RuntimeError("neither 'main' nor 'master' branch found")
 
 
-def git_fetch() -> bool:
-    """Fetch remote branches.
+def start_git_fetch() -> Optional["subprocess.Popen[bytes]"]:
+    """Start fetching remote branches in the background.
 
     Returns:
-        True if successful or no remote, False on error
+        Running fetch process, or None if git could not be started
     """
     try:
-        subprocess.run(
-            ["git", "fetch"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
+        return subprocess.Popen(
+            ["git", "fetch", "--quiet"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
-        return True
-    except subprocess.CalledProcessError:
+    except FileNotFoundError:
+        return None
+
+
+def wait_for_git_fetch(process: Optional["subprocess.Popen[bytes]"], timeout: int = 30) -> bool:
+    """Wait for a fetch started by start_git_fetch to finish.
+
+    Args:
+        process: Fetch process, or None if it could not be started
+        timeout: Seconds to wait before killing the fetch
+
+    Returns:
+        True if successful or no remote, False on error
+    """
+    if process is None:
         return False
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    try:
+        return process.wait(timeout=timeout) == 0
+    except subprocess.TimeoutExpired:
+        cancel_git_fetch(process)
         return False
 
 
+def cancel_git_fetch(process: Optional["subprocess.Popen[bytes]"], grace: float = 5) -> None:
+    """Stop and reap a fetch started by start_git_fetch if it is still running.
+
+    The fetch is asked to terminate first so git can remove its lock and
+    temporary pack files; it is only killed if it outlives the grace period.
+
+    Args:
+        process: Fetch process, or None if it could not be started
+        grace: Seconds to wait after SIGTERM before killing the fetch
+    """
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def git_fetch() -> bool:
+    """Fetch remote branches.
+
+    Returns:
+        True if successful or no remote, False on error
+    """
+    return wait_for_git_fetch(start_git_fetch())
+
+
 def list_all_branches() -> list[str]:
     """List all local and remote branches.
 
@@ -141,16 +261,26 @@ def list_all_branches() -> list[str]:
     """
     try:
         result = subprocess.run(
-            ["git", "branch", "-a", "--format=%(refname:short)"],
-            capture_output=True,
+            ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/", "refs/remotes/"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=True,
             timeout=5
         )
-        branches = result.stdout.strip().split("\n")
-        return [b for b in branches if b]  # Filter out empty strings
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return []
+
+    if result.returncode != 0:
         return []
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+# Known `git worktree add` failures: stderr substring -> message prefix
+_WORKTREE_ERRORS: tuple[tuple[str, str], ...] = (
+    ("already exists", "Branch or worktree already exists"),
+    ("Permission denied", "Permission denied"),
+    ("invalid reference", "Invalid base branch"),
+)
 
 
 def create_worktree(path: Path, branch_name: str, base_branch: str) -> bool:
@@ -177,10 +307,9 @@ def create_worktree(path: Path, branch_name: str, base_branch: str) -> bool:
         )
         return True
     except subprocess.CalledProcessError as e:
-        if "already exists" in e.stderr:
-            raise RuntimeError(f"Branch or worktree already exists: {e.stderr}")
-        if "Permission denied" in e.stderr:
-            raise RuntimeError(f"Permission denied: {e.stderr}")
+        for needle, message in _WORKTREE_ERRORS:
+            if needle in e.stderr:
+                raise RuntimeError(f"{message}: {e.stderr}")
         raise RuntimeError(f"Git worktree creation failed: {e.stderr}")
     except (FileNotFoundError, subprocess.TimeoutExpired) as e:
         raise RuntimeError(f"Git worktree creation failed: {e}")
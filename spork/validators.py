@@ -3,39 +3,91 @@
 This module provides validation functions for prerequisites.
 """
 
+import re
+import shutil
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 from spork.data_models import ValidationResult
 
+# .gitignore entries that exclude Spec Kit: ".specify" or anything under ".specify/"
+_SPECIFY_IGNORE_RE = re.compile(r"^[ \t]*\.specify(?:/.*)?[ \t]*$", re.MULTILINE)
+
+# Objects a committed Spec Kit must have, with their expected git object type
+_SPEC_KIT_OBJECTS = (
+    (".specify/memory/constitution.md", "blob"),
+    (".specify/templates", "tree"),
+    (".specify/scripts", "tree"),
+)
+
+
+def _run(args: list[str], cwd: Path, input: str) -> "subprocess.CompletedProcess[str]":
+    """Run a git query for a validator.
+
+    Args:
+        args: Command and arguments
+        cwd: Directory to run in
+        input: Text written to the command's stdin
+
+    Returns:
+        Completed process with stdout captured as text
+
+    Raises:
+        subprocess.TimeoutExpired: If the command takes longer than 5 seconds
+    """
+    return subprocess.run(
+        args,
+        cwd=str(cwd),
+        input=input,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=5
+    )
+
 
 def is_git_installed() -> ValidationResult:
     """Validate that git is installed.
 
     Returns:
-        ValidationResult with passed=True if git is installed
+        ValidationResult with passed=True if git is found in PATH
     """
-    try:
-        subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5
-        )
+    if shutil.which("git") is not None:
         return ValidationResult(
             check_name="git_installed",
             passed=True,
             error_message=None,
             suggestion=None
         )
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+    return ValidationResult(
+        check_name="git_installed",
+        passed=False,
+        error_message="Git is not installed or not in PATH",
+        suggestion="Install git: https://git-scm.com/downloads"
+    )
+
+
+def _check_gitignore(content: str) -> Optional[ValidationResult]:
+    """Check .gitignore content for entries that exclude Spec Kit.
+
+    Args:
+        content: Text of the repository's .gitignore
+
+    Returns:
+        Failed ValidationResult if .specify/ is ignored, None otherwise
+    """
+    if _SPECIFY_IGNORE_RE.search(content):
         return ValidationResult(
-            check_name="git_installed",
+            check_name="spec_kit_on_main",
             passed=False,
-            error_message="Git is not installed or not in PATH",
-            suggestion="Install git: https://git-scm.com/downloads"
+            error_message="Spec Kit (.specify/) is listed in .gitignore",
+            suggestion=(
+                "Remove .specify/ from .gitignore to allow committing "
+                "Spec Kit to the repository"
+            )
         )
+    return None
 
 
 def is_spec_kit_initialized(repo_path: Path, main_branch: str) -> ValidationResult:
@@ -49,43 +101,22 @@ def is_spec_kit_initialized(repo_path: Path, main_branch: str) -> ValidationResu
         ValidationResult with passed=True if Spec Kit is initialized on main branch
     """
     # First check if .specify/ is in .gitignore
-    gitignore_path = repo_path / ".gitignore"
-    if gitignore_path.exists():
-        gitignore_content = gitignore_path.read_text()
-        for line in gitignore_content.splitlines():
-            line = line.strip()
-            # Check for .specify/ patterns (exact match or with wildcards)
-            if line in [".specify/", ".specify", ".specify/*"] or line.startswith(".specify/"):
-                return ValidationResult(
-                    check_name="spec_kit_on_main",
-                    passed=False,
-                    error_message="Spec Kit (.specify/) is listed in .gitignore",
-                    suggestion=(
-                        "Remove .specify/ from .gitignore to allow committing "
-                        "Spec Kit to the repository"
-                    )
-                )
+    # Read directly rather than exists() + read, saving a stat() call
+    try:
+        gitignore_content = (repo_path / ".gitignore").read_text()
+    except FileNotFoundError:
+        gitignore_content = ""
+    ignored = _check_gitignore(gitignore_content)
+    if ignored is not None:
+        return ignored
 
     # Then check if Spec Kit exists on the main branch
     # This ensures worktrees created from main will have Spec Kit
+    # One cat-file query reports the type of each required object,
+    # instead of listing every file tracked under .specify/
+    query = "".join(f"{main_branch}:{path}\n" for path, _ in _SPEC_KIT_OBJECTS)
     try:
-        result = subprocess.run(
-            ["git", "show", f"{main_branch}:.specify/memory/constitution.md"],
-            cwd=str(repo_path),
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            return ValidationResult(
-                check_name="spec_kit_on_main",
-                passed=False,
-                error_message=f"Spec Kit not found on {main_branch} branch",
-                suggestion=(
-                    f"Ensure Spec Kit is initialized and committed to {main_branch} branch "
-                    "before creating feature worktrees"
-                )
-            )
+        result = _run(["git", "cat-file", "--batch-check"], repo_path, query)
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return ValidationResult(
             check_name="spec_kit_on_main",
@@ -94,37 +125,35 @@ def is_spec_kit_initialized(repo_path: Path, main_branch: str) -> ValidationResu
             suggestion="Ensure git is working and you have network access"
         )
 
-    # Also verify Spec Kit structure on main branch
-    required_paths = [
-        f"{main_branch}:.specify/templates",
-        f"{main_branch}:.specify/scripts"
-    ]
-
-    for git_path in required_paths:
-        try:
-            result = subprocess.run(
-                ["git", "ls-tree", git_path],
-                cwd=str(repo_path),
-                capture_output=True,
-                text=True,
-                timeout=5
+    # Each line is "<oid> <type> <size>", or "<object> missing"
+    lines = result.stdout.splitlines() if result.returncode == 0 else []
+    found = {
+        path
+        for (path, expected), fields in zip(_SPEC_KIT_OBJECTS, map(str.split, lines))
+        if fields[1:2] == [expected]
+    }
+
+    if ".specify/memory/constitution.md" not in found:
+        return ValidationResult(
+            check_name="spec_kit_on_main",
+            passed=False,
+            error_message=f"Spec Kit not found on {main_branch} branch",
+            suggestion=(
+                f"Ensure Spec Kit is initialized and committed to {main_branch} branch "
+                "before creating feature worktrees"
             )
-            if result.returncode != 0 or not result.stdout.strip():
-                path_name = git_path.split(":")[-1]
-                return ValidationResult(
-                    check_name="spec_kit_on_main",
-                    passed=False,
-                    error_message=(
-                        f"Spec Kit incomplete on {main_branch} branch ({path_name} missing)"
-                    ),
-                    suggestion=f"Run 'specify init .' and commit to {main_branch} branch"
-                )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        )
+
+    # Also verify Spec Kit structure on main branch
+    for path_name in (".specify/templates", ".specify/scripts"):
+        if path_name not in found:
             return ValidationResult(
                 check_name="spec_kit_on_main",
                 passed=False,
-                error_message=f"Could not verify Spec Kit structure on {main_branch} branch",
-                suggestion="Ensure git is working properly"
+                error_message=(
+                    f"Spec Kit incomplete on {main_branch} branch ({path_name} missing)"
+                ),
+                suggestion=f"Run 'specify init .' and commit to {main_branch} branch"
             )
 
     return ValidationResult(
@@ -139,26 +168,19 @@ def is_claude_code_installed() -> ValidationResult:
     """Validate that Claude Code is installed.
 
     Returns:
-        ValidationResult with passed=True if Claude Code is installed
+        ValidationResult with passed=True if Claude Code is found in PATH
     """
-    try:
-        subprocess.run(
-            ["claude", "--version"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5
-        )
+    if shutil.which("claude") is not None:
         return ValidationResult(
             check_name="claude_code_installed",
             passed=True,
             error_message=None,
             suggestion=None
         )
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return ValidationResult(
-            check_name="claude_code_installed",
-            passed=False,
-            error_message="Claude Code not found in PATH",
-            suggestion="Install Claude Code or add to PATH"
-        )
+    return ValidationResult(
+        check_name="claude_code_installed",
+        passed=False,
+        error_message="Claude Code not found in PATH",
+        suggestion="Install Claude Code or add to PATH"
+    )
+
@@ -4,9 +4,15 @@ This module provides functions for feature name sanitization and feature number
 """
 
 import re
+from collections.abc import Iterable
 
 from spork.data_models import FeatureNumber
 
+# Any run of non-alphanumerics (spaces, underscores, hyphens, symbols) becomes one hyphen
+_NON_ALNUM_RUN_RE = re.compile(r"[^a-z0-9]+")
+# Feature branch names: 3 digits at start of a line followed by hyphen
+_FEATURE_NUMBER_RE = re.compile(r"^(\d{3})-", re.MULTILINE)
+
 
 def sanitize_feature_name(name: str, max_length: int = 50) -> str:
     """Sanitize feature name for use in git branch names.
@@ -21,18 +27,9 @@ def sanitize_feature_name(name: str, max_length: int = 50) -> str:
     Returns:
         Sanitized feature name safe for git branch names
     """
-    # Convert to lowercase
-    sanitized = name.lower()
-
-    # Replace underscores and spaces with hyphens
-    sanitized = sanitized.replace("_", "-")
-    sanitized = sanitized.replace(" ", "-")
-
-    # Remove all non-alphanumeric characters except hyphens
-    sanitized = re.sub(r"[^a-z0-9-]", "-", sanitized)
-
-    # Collapse multiple consecutive hyphens into single hyphen
-    sanitized = re.sub(r"-+", "-", sanitized)
+    # Lowercase, then replace each run of separators and special characters
+    # with a single hyphen in one pass
+    sanitized = _NON_ALNUM_RUN_RE.sub("-", name.lower())
 
     # Strip leading and trailing hyphens
     sanitized = sanitized.strip("-")
@@ -46,13 +43,13 @@ def sanitize_feature_name(name: str, max_length: int = 50) -> str:
     return sanitized
 
 
-def get_next_feature_number(branches: list[str]) -> FeatureNumber:
+def get_next_feature_number(branches: Iterable[str]) -> FeatureNumber:
     r"""Determine the next feature number based on existing branches.
 
     Parses branch names matching the pattern ^\d{3}- and returns max + 1.
 
     Args:
-        branches: List of all local and remote branch names
+        branches: All local and remote branch names, in any iterable
 
     Returns:
         FeatureNumber with next available number
@@ -60,25 +57,16 @@ def get_next_feature_number(branches: list[str]) -> FeatureNumber:
     Raises:
         ValueError: If next number would exceed 999
     """
-    # Pattern: 3 digits at start followed by hyphen
-    pattern = re.compile(r"^(\d{3})-")
-
-    feature_numbers = []
-    for branch in branches:
-        # Remove remote prefix if present (e.g., "origin/001-feature" -> "001-feature")
-        branch_name = branch.split("/")[-1]
-        match = pattern.match(branch_name)
-        if match:
-            feature_numbers.append(int(match.group(1)))
+    # Remove remote prefix if present (e.g., "origin/001-feature" -> "001-feature")
+    # and scan all names in one pass
+    joined = "\n".join(branch.rsplit("/", 1)[-1] for branch in branches)
+    feature_numbers = _FEATURE_NUMBER_RE.findall(joined)
 
     # Determine next number
-    if feature_numbers:
-        next_number = max(feature_numbers) + 1
-    else:
-        next_number = 1
+    next_number = max((int(n) for n in feature_numbers), default=0) + 1
 
     # Validate range
     if next_number > 999:
         raise ValueError(f"Feature number {next_number} exceeds maximum of 999")
 
-    return FeatureNumber(number=next_number, formatted=f"{next_number:03d}")
+    return FeatureNumber(number=next_number)
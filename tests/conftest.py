@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from spork import git_operations
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_caches():
+    """Reset memoized git/tool probes so each test sees its own mocks."""
+    cached = (
+        git_operations.is_git_installed,
+        git_operations._repo_root_for,
+        git_operations._main_branch_for,
+    )
+    for func in cached:
+        func.cache_clear()
+    yield
+    for func in cached:
+        func.cache_clear()
+
+
+@pytest.fixture
+def fp(fp):
+    """pytest-subprocess's fp, letting each registered command serve repeats.
+
+    Overriding fp rather than using an autouse fixture keeps the Popen hook
+    out of tests that never spawn a process.
+    """
+    fp.keep_last_process(True)
+    return fp
+
@@ -4,62 +4,108 @@ This module tests the complete CLI workflow from argument parsing
 to worktree creation and Claude Code launch.
 """
 
+import re
+import signal
+import threading
 
 import pytest
 from click.testing import CliRunner
 
+from spork.cli import cli
 
-@pytest.fixture
+pytestmark = pytest.mark.xdist_group("cli_integration")
+
+REPO_TOPLEVEL_ARGS = ["rev-parse", "--is-inside-work-tree", "--show-toplevel"]
+REPO_REFS_ARGS = ["for-each-ref", "--format=%(refname) %(symref)", "refs/heads/", "refs/remotes/"]
+GIT_FETCH = ["git", "fetch", "--quiet"]
+BRANCH_LISTING = [
+    "git", "for-each-ref", "--format=%(refname:short)", "refs/heads/", "refs/remotes/"
+]
+SPEC_KIT_CAT_FILE = ["git", "cat-file", "--batch-check"]
+
+_SPEC_KIT_RE = re.compile(r"spec kit|\.specify|main", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
 def runner():
     """Provide Click CLI runner for testing."""
     return CliRunner()
 
 
-def register_spec_kit_on_main_mocks(fp):
-    """Helper to register git commands for Spec Kit validation on main branch."""
+@pytest.fixture
+def fake_repo(monkeypatch, fs):
+    """Provide an in-memory repository root, holding only a .gitignore, as the working directory."""
+    fs.create_file("/repo/.gitignore", contents="node_modules/\n")
+    monkeypatch.chdir("/repo")
+    return "/repo"
+
+
+def mock_path(monkeypatch, *missing):
+    """Report every tool as installed on PATH except those named in missing."""
+    monkeypatch.setattr(
+        "spork.validators.shutil.which",
+        lambda cmd: None if cmd in missing else f"/usr/bin/{cmd}"
+    )
+
+
+def register_repository(fp):
+    """Register the startup lookup of a repository at /repo with only a 'main' branch."""
     fp.register(
-        ["git", "show", "main:.specify/memory/constitution.md"],
-        stdout="# Constitution",
-        returncode=0
+        ["git", "-C", fp.any(), *REPO_TOPLEVEL_ARGS], returncode=0, stdout="true\n/repo\n"
     )
     fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/templates/"],
-        stdout="040000 tree abc123\t.specify/templates",
-        returncode=0
+        ["git", "-C", fp.any(), *REPO_REFS_ARGS], returncode=0, stdout="refs/heads/main \n"
     )
+
+
+def register_spec_kit_on_main(fp):
+    """Register a Spec Kit check finding the constitution, templates and scripts on main."""
     fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/scripts/"],
-        stdout="040000 tree def456\t.specify/scripts",
-        returncode=0
+        SPEC_KIT_CAT_FILE,
+        returncode=0,
+        stdout="3f2a1b4c blob 512\n8d9e0f1a tree 64\n2b3c4d5e tree 48\n"
     )
 
 
+def register_fetch(fp):
+    """Register a background fetch that succeeds."""
+    fp.register(GIT_FETCH, returncode=0)
+
+
+def register_branch_listing(fp):
+    """Register the post-fetch branch listing, reporting only 'main'."""
+    fp.register(BRANCH_LISTING, returncode=0, stdout="main\n")
+
+
+def register_worktree_add(fp, branch):
+    """Register creation of the worktree for branch, returning the expected command."""
+    command = ["git", "worktree", "add", f"/repo/.worktrees/{branch}", "-b", branch, "main"]
+    fp.register(command, returncode=0, stdout="Preparing worktree\n")
+    return command
+
+
+def register_claude_launch(fp, feature, rc=0):
+    """Register Claude Code's /specify launch for feature, exiting with rc."""
+    fp.register(["claude", f"/specify {feature}"], returncode=rc)
+
+
 def test_cli_requires_feature_request(runner):
     """Given no feature request argument
     When running CLI
-    Then should exit with non-zero code and show usage"""
-    from spork.cli import cli
-
+    Then should exit with Click's usage error code"""
     # Given / When
     result = runner.invoke(cli, [])
 
     # Then
-    assert result.exit_code != 0  # Click uses exit code 2 for missing arguments
-    assert "Missing argument" in result.output or "FEATURE_REQUEST" in result.output
+    assert result.exit_code == 2  # Click uses exit code 2 for missing arguments
 
 
-def test_cli_validates_git_installed(runner, fp):
+def test_cli_validates_git_installed(runner, monkeypatch):
     """Given git is not installed
     When running CLI with feature request
     Then should exit with code 1 (validation error) and show error message"""
-    from spork.cli import cli
-
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=127,
-        stderr="command not found: git\n"
-    )
+    mock_path(monkeypatch, "git")
 
     # When
     result = runner.invoke(cli, ["add feature"])
@@ -70,397 +116,154 @@ def test_cli_validates_git_installed(runner, fp):
     assert "not installed" in result.output.lower()
 
 
-def test_cli_validates_git_repository(runner, fp, tmp_path):
+def test_cli_validates_git_repository(runner, fp, monkeypatch):
     """Given not in a git repository
     When running CLI with feature request
     Then should exit with code 1 and show error message"""
-    from spork.cli import cli
-
     # Given
+    mock_path(monkeypatch)
     fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
+        ["git", "-C", fp.any(), *REPO_TOPLEVEL_ARGS],
         returncode=128,
         stderr="fatal: not a git repository\n"
     )
 
     # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["add feature"])
+    result = runner.invoke(cli, ["add feature"])
 
     # Then
     assert result.exit_code == 1
     assert "not in a git repository" in result.output.lower()
 
 
-def test_cli_validates_spec_kit(runner, fp, tmp_path):
+def test_cli_validates_spec_kit(runner, fp, monkeypatch):
     """Given Spec Kit is not initialized on main branch
     When running CLI with feature request
     Then should exit with code 1 and show error message"""
-    from spork.cli import cli
-
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
-        returncode=0,
-        stdout="true\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--show-toplevel"],
-        returncode=0,
-        stdout=str(tmp_path) + "\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=0,
-        stdout="a1b2c3d\n"
-    )
-    register_spec_kit_on_main_mocks(fp)
+    mock_path(monkeypatch)
+    register_repository(fp)
+    register_fetch(fp)
     # Spec Kit missing on main branch
     fp.register(
-        ["git", "show", "main:.specify/memory/constitution.md"],
-        returncode=128,
-        stderr="fatal: path '.specify/memory/constitution.md' does not exist"
+        SPEC_KIT_CAT_FILE,
+        stdout=(
+            "main:.specify/memory/constitution.md missing\n"
+            "main:.specify/templates missing\n"
+            "main:.specify/scripts missing\n"
+        ),
+        returncode=0
     )
 
     # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["add feature"])
+    result = runner.invoke(cli, ["add feature"])
 
     # Then
     assert result.exit_code == 1
-    assert (
-        "spec kit" in result.output.lower()
-        or ".specify" in result.output.lower()
-        or "main" in result.output.lower()
-    )
+    assert _SPEC_KIT_RE.search(result.output)
 
 
-def test_cli_validates_claude_code(runner, fp, tmp_path):
+def test_cli_validates_claude_code(runner, fp, monkeypatch):
     """Given Claude Code is not installed
     When running CLI with feature request
     Then should exit with code 1 and show error message"""
-    from spork.cli import cli
-
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
-        returncode=0,
-        stdout="true\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--show-toplevel"],
-        returncode=0,
-        stdout=str(tmp_path) + "\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=0,
-        stdout="a1b2c3d\n"
-    )
-    register_spec_kit_on_main_mocks(fp)
-    fp.register(
-        ["claude", "--version"],
-        returncode=127,
-        stderr="command not found: claude\n"
-    )
+    mock_path(monkeypatch, "claude")
+    register_repository(fp)
+    register_fetch(fp)
+    register_spec_kit_on_main(fp)
 
     # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["add feature"])
+    result = runner.invoke(cli, ["add feature"])
 
     # Then
     assert result.exit_code == 1
     assert "claude" in result.output.lower()
 
 
-def test_cli_success_path(runner, fp, tmp_path):
-    """Given all validations pass
+def test_cli_terminates_fetch_when_validation_fails(runner, fp, monkeypatch):
+    """Given a slow background fetch and Claude Code not installed
     When running CLI with feature request
-    Then should create worktree and launch Claude Code"""
-    from spork.cli import cli
-
-    # Given - setup Spec Kit
-    spec_kit_dir = tmp_path / ".specify"
-    spec_kit_dir.mkdir()
-    (spec_kit_dir / "memory").mkdir()
-    (spec_kit_dir / "memory" / "constitution.md").write_text("# Constitution")
-    (spec_kit_dir / "templates").mkdir()
-    (spec_kit_dir / "scripts").mkdir()
-
-    # Mock all git and validation commands
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
-        returncode=0,
-        stdout="true\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--show-toplevel"],
-        returncode=0,
-        stdout=str(tmp_path) + "\n"
-    )
-    fp.register(
-        ["claude", "--version"],
-        returncode=0,
-        stdout="claude version 1.0.0\n"
-    )
-    fp.register(
-        ["git", "fetch"],
-        returncode=0
-    )
-    fp.register(
-        ["git", "branch", "-a", "--format=%(refname:short)"],
-        returncode=0,
-        stdout="main\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=0,
-        stdout="a1b2c3d\n"
-    )
-    register_spec_kit_on_main_mocks(fp)
-    fp.register(
-        ["git", "worktree", "add", fp.any(), "-b", fp.any(), "main"],
-        returncode=0,
-        stdout="Preparing worktree\nHEAD is now at a1b2c3d\n"
-    )
-    fp.register(
-        ["claude", "/specify add feature"],
-        returncode=0
-    )
+    Then should exit with code 1 and terminate the fetch instead of leaving it running"""
+    # Given - the fake fetch keeps running until it receives a signal
+    signals = []
+    stopped = threading.Event()
 
-    # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["add feature"])
+    def on_signal(process, sig):
+        signals.append(sig)
+        stopped.set()
 
-    # Then
-    assert result.exit_code == 0
-    assert "✓" in result.output  # Should show checkmarks for progress
-
-
-def test_cli_sanitizes_feature_name(runner, fp, tmp_path):
-    """Given feature request with special characters
-    When running CLI
-    Then should sanitize name for branch creation"""
-    from spork.cli import cli
-
-    # Given - setup Spec Kit
-    spec_kit_dir = tmp_path / ".specify"
-    spec_kit_dir.mkdir()
-    (spec_kit_dir / "memory").mkdir()
-    (spec_kit_dir / "memory" / "constitution.md").write_text("# Constitution")
-    (spec_kit_dir / "templates").mkdir()
-    (spec_kit_dir / "scripts").mkdir()
-
-    # Mock commands
+    mock_path(monkeypatch, "claude")
+    register_repository(fp)
+    register_spec_kit_on_main(fp)
     fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
-        returncode=0,
-        stdout="true\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--show-toplevel"],
-        returncode=0,
-        stdout=str(tmp_path) + "\n"
-    )
-    fp.register(
-        ["claude", "--version"],
-        returncode=0,
-        stdout="claude version 1.0.0\n"
-    )
-    fp.register(
-        ["git", "fetch"],
-        returncode=0
-    )
-    fp.register(
-        ["git", "branch", "-a", "--format=%(refname:short)"],
-        returncode=0,
-        stdout="main\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=0,
-        stdout="a1b2c3d\n"
-    )
-    register_spec_kit_on_main_mocks(fp)
-    fp.register(
-        ["git", "worktree", "add", fp.any(), "-b", "001-fix-bug-123-critical", "main"],
-        returncode=0,
-        stdout="Preparing worktree\n"
-    )
-    fp.register(
-        ["claude", "/specify Fix bug #123 (critical!)"],
-        returncode=0
+        GIT_FETCH,
+        callback=lambda process: stopped.wait(5),
+        signal_callback=on_signal,
+        returncode=-signal.SIGTERM,
     )
 
     # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["Fix bug #123 (critical!)"])
+    result = runner.invoke(cli, ["add feature"])
 
     # Then
-    assert result.exit_code == 0
-    # Verify sanitized name appears in output
-    assert (
-        "001-fix-bug-123-critical" in result.output.lower()
-        or "fix-bug-123-critical" in result.output.lower()
-    )
-
-
-def test_cli_handles_special_characters(runner, fp, tmp_path):
-    """Given feature request with various special characters
-    When running CLI
-    Then should handle them properly"""
-    from spork.cli import cli
-
-    # Given - setup Spec Kit
-    spec_kit_dir = tmp_path / ".specify"
-    spec_kit_dir.mkdir()
-    (spec_kit_dir / "memory").mkdir()
-    (spec_kit_dir / "memory" / "constitution.md").write_text("# Constitution")
-    (spec_kit_dir / "templates").mkdir()
-    (spec_kit_dir / "scripts").mkdir()
-
-    # Mock commands
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
-        returncode=0,
-        stdout="true\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--show-toplevel"],
-        returncode=0,
-        stdout=str(tmp_path) + "\n"
-    )
-    fp.register(
-        ["claude", "--version"],
-        returncode=0,
-        stdout="claude version 1.0.0\n"
-    )
-    fp.register(
-        ["git", "fetch"],
-        returncode=0
-    )
-    fp.register(
-        ["git", "branch", "-a", "--format=%(refname:short)"],
-        returncode=0,
-        stdout="main\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=0,
-        stdout="a1b2c3d\n"
-    )
-    register_spec_kit_on_main_mocks(fp)
-    fp.register(
-        ["git", "worktree", "add", fp.any(), "-b", fp.any(), "main"],
-        returncode=0,
-        stdout="Preparing worktree\n"
-    )
-    fp.register(
-        ["claude", "/specify Add @user support & email!"],
-        returncode=0
-    )
+    assert result.exit_code == 1
+    assert signals == [signal.SIGTERM]
+
+
+@pytest.mark.parametrize(
+    "feature, branch, claude_rc",
+    [
+        ("add feature", "001-add-feature", 0),
+        ("Fix bug #123 (critical!)", "001-fix-bug-123-critical", 0),
+        ("Add @user support & email!", "001-add-user-support-email", 0),
+        ("test", "001-test", 2),  # Claude's non-zero exit code is propagated
+    ],
+    ids=["success", "sanitizes_name", "special_characters", "propagates_exit_code"],
+)
+def test_cli_success_path(runner, fp, monkeypatch, fake_repo, feature, branch, claude_rc):
+    """Given all validations pass
+    When running CLI with feature request
+    Then should create worktree on the sanitized branch, launch Claude Code
+    and exit with Claude's exit code"""
+    # Given
+    mock_path(monkeypatch)
+    register_repository(fp)
+    register_spec_kit_on_main(fp)
+    register_fetch(fp)
+    register_branch_listing(fp)
+    worktree_add = register_worktree_add(fp, branch)
+    register_claude_launch(fp, feature, claude_rc)
 
     # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["Add @user support & email!"])
+    result = runner.invoke(cli, [feature])
 
     # Then
-    assert result.exit_code == 0
+    assert result.exit_code == claude_rc
+    assert "✓" in result.output  # Should show checkmarks for progress
+    assert f"Creating worktree at .worktrees/{branch}" in result.output
+    assert fp.call_count(worktree_add) == 1
+    assert fp.call_count(["claude", f"/specify {feature}"]) == 1
 
 
-def test_cli_propagates_claude_exit_code(runner, fp, tmp_path):
-    """Given Claude Code exits with non-zero code
+def test_cli_no_fetch_skips_git_fetch(runner, fp, monkeypatch, fake_repo):
+    """Given --no-fetch flag
     When running CLI
-    Then should propagate the same exit code"""
-    from spork.cli import cli
-
-    # Given - setup Spec Kit
-    spec_kit_dir = tmp_path / ".specify"
-    spec_kit_dir.mkdir()
-    (spec_kit_dir / "memory").mkdir()
-    (spec_kit_dir / "memory" / "constitution.md").write_text("# Constitution")
-    (spec_kit_dir / "templates").mkdir()
-    (spec_kit_dir / "scripts").mkdir()
-
-    # Mock commands
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
-    fp.register(
-        ["git", "-C", fp.any(), "rev-parse", "--is-inside-work-tree"],
-        returncode=0,
-        stdout="true\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--show-toplevel"],
-        returncode=0,
-        stdout=str(tmp_path) + "\n"
-    )
-    fp.register(
-        ["claude", "--version"],
-        returncode=0,
-        stdout="claude version 1.0.0\n"
-    )
-    fp.register(
-        ["git", "fetch"],
-        returncode=0
-    )
-    fp.register(
-        ["git", "branch", "-a", "--format=%(refname:short)"],
-        returncode=0,
-        stdout="main\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=0,
-        stdout="a1b2c3d\n"
-    )
-    register_spec_kit_on_main_mocks(fp)
-    fp.register(
-        ["git", "worktree", "add", fp.any(), "-b", fp.any(), "main"],
-        returncode=0,
-        stdout="Preparing worktree\n"
-    )
-    fp.register(
-        ["claude", "/specify test"],
-        returncode=2  # Claude exits with code 2
-    )
+    Then should not fetch remote branches"""
+    # Given
+    mock_path(monkeypatch)
+    register_repository(fp)
+    register_spec_kit_on_main(fp)
+    register_worktree_add(fp, "001-add-feature")
+    register_claude_launch(fp, "add feature")
 
     # When
-    with runner.isolated_filesystem(temp_dir=tmp_path):
-        result = runner.invoke(cli, ["test"])
+    result = runner.invoke(cli, ["--no-fetch", "add feature"])
 
     # Then
-    assert result.exit_code == 2  # Should propagate Claude's exit code
+    assert result.exit_code == 0
+    assert fp.call_count(GIT_FETCH) == 0
+    # Branch names come from the startup repository lookup instead
+    assert fp.call_count(BRANCH_LISTING) == 0
+    assert "Fetching remote branches" not in result.output
+
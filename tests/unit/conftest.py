@@ -0,0 +1,96 @@
+"""Shared fixtures for unit tests."""
+
+from pathlib import Path
+
+import pytest
+
+from spork.data_models import (
+    CommandContext,
+    FeatureNumber,
+    FeatureRequest,
+    GitRepository,
+    ValidationResult,
+    WorktreeConfig,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_pydantic_models():
+    """Validate each Pydantic model once before the first unit test runs.
+
+    Keeps pydantic-core's first-use cost out of whichever test happens to run
+    first. The dataclass models have no validator to warm.
+    """
+    FeatureRequest(text="warm", sanitized_name="warm")
+    ValidationResult(check_name="warm", passed=True)
+
+
+@pytest.fixture(scope="session")
+def sample_feature_request():
+    """Provide a FeatureRequest; frozen, so safe to share across tests."""
+    return FeatureRequest(text="test", sanitized_name="test")
+
+
+@pytest.fixture(scope="session")
+def sample_feature_number():
+    """Provide FeatureNumber 001."""
+    return FeatureNumber(number=1)
+
+
+@pytest.fixture(scope="session")
+def sample_git_repository():
+    """Provide a GitRepository on 'main'."""
+    return GitRepository(
+        root_path=Path("/test"),
+        current_branch="main",
+        has_remote=True,
+        main_branch="main"
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_worktree_config(sample_feature_number, sample_feature_request):
+    """Provide a WorktreeConfig composed of the sample feature number and request."""
+    return WorktreeConfig(
+        branch_name="001-test",
+        directory_path=Path(".worktrees/001-test"),
+        base_branch="main",
+        feature_number=sample_feature_number,
+        feature_request=sample_feature_request
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_validation_result():
+    """Provide a passing ValidationResult, skipping validation (not under test)."""
+    return ValidationResult.model_construct(
+        check_name="git_installed",
+        passed=True,
+        error_message=None,
+        suggestion=None
+    )
+
+
+@pytest.fixture(scope="session")
+def full_command_context(
+    sample_git_repository, sample_worktree_config, sample_validation_result
+):
+    """Provide a CommandContext with every field populated.
+
+    CommandContext is mutable; tests using this fixture must only read it.
+    """
+    return CommandContext(
+        original_cwd=Path("/test"),
+        repository=sample_git_repository,
+        worktree_config=sample_worktree_config,
+        validation_results=[sample_validation_result]
+    )
+
+
+@pytest.fixture(scope="module")
+def spec_kit_dir(tmp_path_factory):
+    """Provide an empty repository root shared by a module's validator tests.
+
+    Tests writing files here must remove them again.
+    """
+    return tmp_path_factory.mktemp("spec_kit")
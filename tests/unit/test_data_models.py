@@ -1,21 +1,60 @@
-"""Tests for Pydantic data models.
+"""Tests for data models.
 
-This module tests all 6 Pydantic models with their field validators,
-model validators, and validation rules.
+This module tests all 6 data models (Pydantic models and dataclasses)
+with their validators and validation rules.
 """
 
+import os
+import re
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
-from pydantic import ValidationError
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+from pydantic import TypeAdapter, ValidationError
+
+from spork.data_models import (
+    CommandContext,
+    FeatureNumber,
+    FeatureRequest,
+    GitRepository,
+    ValidationResult,
+    WorktreeConfig,
+)
+
+# Paths are immutable, so each is built once and shared
+_TEST_PATH = Path("/test")
+_PROJECT_PATH = Path("/Users/dev/my-project")
+_CWD_PATH = Path("/Users/dev/project")
+_WT_PATH_001 = Path(".worktrees/001-test")
+_WT_PATH_ADD_AUTH = Path(".worktrees/001-add-auth")
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+_ERR_MIN_LEN = re.compile("at least 1 character")
+_ERR_MAX_LEN = re.compile("at most 500 characters")
+_ERR_PATTERN = re.compile("String should match pattern")
+_ERR_MESSAGE_REQUIRED = re.compile("error_message required")
+_ERR_MAIN_BRANCH = re.compile("must be 'main' or 'master'")
+_ERR_NUMBER_MIN = re.compile("greater than or equal to 1")
+_ERR_NUMBER_MAX = re.compile("less than or equal to 999")
+_ERR_FROZEN = re.compile("frozen")
+_ERR_FROZEN_FIELD = re.compile("cannot assign to field")
+
+# Validates a whole batch of FeatureRequests in a single pydantic-core call
+_FEATURE_REQUESTS_ADAPTER = TypeAdapter(list[FeatureRequest])
+
+
+def _assert_raises(error, pattern, func, *args, **kwargs):
+    """Assert that func(*args, **kwargs) raises error with a message matching pattern."""
+    with pytest.raises(error, match=pattern):
+        func(*args, **kwargs)
 
 
 def test_feature_request_valid():
     """Given valid feature request data
     When creating FeatureRequest model
     Then model should be created successfully with sanitized name"""
-    from spork.data_models import FeatureRequest
-
     # Given
     text = "Add user authentication system"
     sanitized_name = "add-user-authentication-system"
@@ -33,73 +72,60 @@ def test_feature_request_text_min_length():
     """Given empty text
     When creating FeatureRequest model
     Then validation error should be raised"""
-    from spork.data_models import FeatureRequest
-
     # Given / When / Then
-    with pytest.raises(ValidationError, match="at least 1 character"):
-        FeatureRequest(text="", sanitized_name="test")
+    _assert_raises(ValidationError, _ERR_MIN_LEN, FeatureRequest, text="", sanitized_name="test")
 
 
 def test_feature_request_text_max_length():
     """Given text exceeding 500 characters
     When creating FeatureRequest model
     Then validation error should be raised"""
-    from spork.data_models import FeatureRequest
-
     # Given
     long_text = "x" * 501
 
     # When / Then
-    with pytest.raises(ValidationError, match="at most 500 characters"):
-        FeatureRequest(text=long_text, sanitized_name="test")
+    _assert_raises(
+        ValidationError, _ERR_MAX_LEN, FeatureRequest, text=long_text, sanitized_name="test"
+    )
 
 
 def test_feature_request_sanitized_name_validation():
     """Given sanitized name with invalid characters
     When creating FeatureRequest model
     Then validation error should be raised"""
-    from spork.data_models import FeatureRequest
-
     # Given / When / Then
-    with pytest.raises(ValidationError, match="alphanumeric and hyphens"):
-        FeatureRequest(text="test", sanitized_name="test_with_underscore")
-
+    _assert_raises(
+        ValidationError, _ERR_PATTERN,
+        FeatureRequest, text="test", sanitized_name="test_with_underscore"
+    )
 
-def test_feature_request_sanitized_name_valid_characters():
-    """Given sanitized name with only alphanumeric and hyphens
-    When creating FeatureRequest model
-    Then model should be created successfully"""
-    from spork.data_models import FeatureRequest
 
+@settings(max_examples=8)
+@given(
+    names=st.lists(st.from_regex(r"[a-z0-9-]{1,50}", fullmatch=True), min_size=1, max_size=4)
+)
+@example(names=["test", "test-123", "add-user-auth", "fix-bug-42"])
+@example(names=["12345"])  # all digits
+@example(names=["-leading", "trailing-"])  # hyphen at either end
+@example(names=["a" * 50])  # at max_length
+def test_feature_request_sanitized_name_valid_characters(names):
+    """Given sanitized names with only alphanumeric and hyphens
+    When creating FeatureRequest models
+    Then models should be created successfully"""
     # Given
-    valid_names = ["test", "test-123", "add-user-auth", "fix-bug-42"]
-
-    # When / Then
-    for name in valid_names:
-        request = FeatureRequest(text="test", sanitized_name=name)
-        assert request.sanitized_name == name
-
+    inputs = [{"text": "test", "sanitized_name": name} for name in names]
 
-def test_feature_request_immutable():
-    """Given created FeatureRequest model
-    When attempting to modify fields
-    Then validation error should be raised (frozen model)"""
-    from spork.data_models import FeatureRequest
-
-    # Given
-    request = FeatureRequest(text="test", sanitized_name="test")
+    # When
+    requests = _FEATURE_REQUESTS_ADAPTER.validate_python(inputs)
 
-    # When / Then
-    with pytest.raises(ValidationError, match="frozen"):
-        request.text = "new text"  # type: ignore
+    # Then
+    assert [request.sanitized_name for request in requests] == names
 
 
 def test_validation_result_passed_no_error():
     """Given validation result with passed=True
     When creating ValidationResult model
     Then model should be created with error_message=None"""
-    from spork.data_models import ValidationResult
-
     # Given / When
     result = ValidationResult(
         check_name="git_installed",
@@ -117,24 +143,21 @@ def test_validation_result_failed_requires_error_message():
     """Given validation result with passed=False and no error_message
     When creating ValidationResult model
     Then validation error should be raised"""
-    from spork.data_models import ValidationResult
-
     # Given / When / Then
-    with pytest.raises(ValidationError, match="error_message required"):
-        ValidationResult(
-            check_name="git_installed",
-            passed=False,
-            error_message=None,
-            suggestion=None
-        )
+    _assert_raises(
+        ValidationError, _ERR_MESSAGE_REQUIRED,
+        ValidationResult,
+        check_name="git_installed",
+        passed=False,
+        error_message=None,
+        suggestion=None
+    )
 
 
 def test_validation_result_failed_with_error_message():
     """Given validation result with passed=False and error_message
     When creating ValidationResult model
     Then model should be created successfully"""
-    from spork.data_models import ValidationResult
-
     # Given / When
     result = ValidationResult(
         check_name="git_installed",
@@ -149,41 +172,20 @@ def test_validation_result_failed_with_error_message():
     assert result.suggestion == "Install git from https://git-scm.com"
 
 
-def test_validation_result_immutable():
-    """Given created ValidationResult model
-    When attempting to modify fields
-    Then validation error should be raised (frozen model)"""
-    from spork.data_models import ValidationResult
-
-    # Given
-    result = ValidationResult(
-        check_name="test",
-        passed=True,
-        error_message=None,
-        suggestion=None
-    )
-
-    # When / Then
-    with pytest.raises(ValidationError, match="frozen"):
-        result.passed = False  # type: ignore
-
-
 def test_git_repository_valid():
     """Given valid git repository data
     When creating GitRepository model
     Then model should be created successfully"""
-    from spork.data_models import GitRepository
-
     # Given / When
     repo = GitRepository(
-        root_path=Path("/Users/dev/my-project"),
+        root_path=_PROJECT_PATH,
         current_branch="main",
         has_remote=True,
         main_branch="main"
     )
 
     # Then
-    assert repo.root_path == Path("/Users/dev/my-project")
+    assert os.fspath(repo.root_path) == "/Users/dev/my-project"
     assert repo.current_branch == "main"
     assert repo.has_remote is True
     assert repo.main_branch == "main"
@@ -193,81 +195,40 @@ def test_git_repository_main_branch_validation():
     """Given main_branch that is not 'main' or 'master'
     When creating GitRepository model
     Then validation error should be raised"""
-    from spork.data_models import GitRepository
-
     # Given / When / Then
-    with pytest.raises(ValidationError, match="must be 'main' or 'master'"):
-        GitRepository(
-            root_path=Path("/test"),
-            current_branch="develop",
-            has_remote=True,
-            main_branch="develop"
-        )
-
-
-def test_git_repository_accepts_main():
-    """Given main_branch='main'
-    When creating GitRepository model
-    Then model should be created successfully"""
-    from spork.data_models import GitRepository
-
-    # Given / When
-    repo = GitRepository(
-        root_path=Path("/test"),
-        current_branch="main",
+    _assert_raises(
+        ValueError, _ERR_MAIN_BRANCH,
+        GitRepository,
+        root_path=_TEST_PATH,
+        current_branch="develop",
         has_remote=True,
-        main_branch="main"
+        main_branch="develop"
     )
 
-    # Then
-    assert repo.main_branch == "main"
-
 
-def test_git_repository_accepts_master():
-    """Given main_branch='master'
+@pytest.mark.parametrize("main_branch", ["main", "master"])
+def test_git_repository_accepts_main_branch(main_branch):
+    """Given main_branch='main' or 'master'
     When creating GitRepository model
     Then model should be created successfully"""
-    from spork.data_models import GitRepository
-
     # Given / When
     repo = GitRepository(
-        root_path=Path("/test"),
-        current_branch="master",
+        root_path=_TEST_PATH,
+        current_branch=main_branch,
         has_remote=True,
-        main_branch="master"
+        main_branch=main_branch
     )
 
     # Then
-    assert repo.main_branch == "master"
-
-
-def test_git_repository_immutable():
-    """Given created GitRepository model
-    When attempting to modify fields
-    Then validation error should be raised (frozen model)"""
-    from spork.data_models import GitRepository
-
-    # Given
-    repo = GitRepository(
-        root_path=Path("/test"),
-        current_branch="main",
-        has_remote=True,
-        main_branch="main"
-    )
-
-    # When / Then
-    with pytest.raises(ValidationError, match="frozen"):
-        repo.main_branch = "master"  # type: ignore
+    assert repo.main_branch == main_branch
 
 
 def test_feature_number_valid():
-    """Given valid feature number and formatted string
+    """Given valid feature number
     When creating FeatureNumber model
     Then model should be created successfully"""
-    from spork.data_models import FeatureNumber
-
     # Given / When
-    feature_num = FeatureNumber(number=42, formatted="042")
+    feature_num = FeatureNumber(number=42)
 
     # Then
     assert feature_num.number == 42
@@ -278,90 +239,45 @@ def test_feature_number_range_validation_min():
     """Given number less than 1
     When creating FeatureNumber model
     Then validation error should be raised"""
-    from spork.data_models import FeatureNumber
-
     # Given / When / Then
-    with pytest.raises(ValidationError, match="greater than or equal to 1"):
-        FeatureNumber(number=0, formatted="000")
+    _assert_raises(ValueError, _ERR_NUMBER_MIN, FeatureNumber, number=0)
 
 
 def test_feature_number_range_validation_max():
     """Given number greater than 999
     When creating FeatureNumber model
     Then validation error should be raised"""
-    from spork.data_models import FeatureNumber
-
-    # Given / When / Then
-    with pytest.raises(ValidationError, match="less than or equal to 999"):
-        FeatureNumber(number=1000, formatted="1000")
-
-
-def test_feature_number_formatted_pattern():
-    """Given formatted string not matching 3-digit pattern
-    When creating FeatureNumber model
-    Then validation error should be raised"""
-    from spork.data_models import FeatureNumber
-
-    # Given / When / Then
-    with pytest.raises(ValidationError, match=r"String should match pattern"):
-        FeatureNumber(number=1, formatted="1")
-
-
-def test_feature_number_consistency_validation():
-    """Given formatted string not matching number
-    When creating FeatureNumber model
-    Then validation error should be raised"""
-    from spork.data_models import FeatureNumber
-
     # Given / When / Then
-    with pytest.raises(ValidationError, match="formatted '042' must match number 001"):
-        FeatureNumber(number=1, formatted="042")
+    _assert_raises(ValueError, _ERR_NUMBER_MAX, FeatureNumber, number=1000)
 
 
-def test_feature_number_consistency_valid():
-    """Given formatted string matching number
+@pytest.mark.parametrize(
+    "number, formatted", [(1, "001"), (42, "042"), (123, "123"), (999, "999")]
+)
+def test_feature_number_formatted_computed(number, formatted):
+    """Given a feature number
     When creating FeatureNumber model
-    Then model should be created successfully"""
-    from spork.data_models import FeatureNumber
-
-    # Given
-    test_cases = [(1, "001"), (42, "042"), (123, "123"), (999, "999")]
-
-    # When / Then
-    for number, formatted in test_cases:
-        feature_num = FeatureNumber(number=number, formatted=formatted)
-        assert feature_num.number == number
-        assert feature_num.formatted == formatted
-
-
-def test_feature_number_immutable():
-    """Given created FeatureNumber model
-    When attempting to modify fields
-    Then validation error should be raised (frozen model)"""
-    from spork.data_models import FeatureNumber
-
-    # Given
-    feature_num = FeatureNumber(number=1, formatted="001")
+    Then formatted should be the zero-padded 3-digit number"""
+    # Given / When
+    feature_num = FeatureNumber(number=number)
 
-    # When / Then
-    with pytest.raises(ValidationError, match="frozen"):
-        feature_num.number = 2  # type: ignore
+    # Then
+    assert feature_num.number == number
+    assert feature_num.formatted == formatted
 
 
 def test_worktree_config_valid():
     """Given valid worktree configuration data
     When creating WorktreeConfig model
     Then model should be created successfully with nested models"""
-    from spork.data_models import FeatureNumber, FeatureRequest, WorktreeConfig
-
     # Given
-    feature_number = FeatureNumber(number=1, formatted="001")
+    feature_number = FeatureNumber(number=1)
     feature_request = FeatureRequest(text="add auth", sanitized_name="add-auth")
 
     # When
     config = WorktreeConfig(
         branch_name="001-add-auth",
-        directory_path=Path(".worktrees/001-add-auth"),
+        directory_path=_WT_PATH_ADD_AUTH,
         base_branch="main",
         feature_number=feature_number,
         feature_request=feature_request
@@ -369,70 +285,40 @@ def test_worktree_config_valid():
 
     # Then
     assert config.branch_name == "001-add-auth"
-    assert config.directory_path == Path(".worktrees/001-add-auth")
+    assert os.fspath(config.directory_path) == ".worktrees/001-add-auth"
     assert config.base_branch == "main"
     assert config.feature_number == feature_number
     assert config.feature_request == feature_request
 
 
-def test_worktree_config_nested_model_composition():
-    """Given WorktreeConfig with nested Pydantic models
+def test_worktree_config_nested_model_composition(sample_worktree_config):
+    """Given WorktreeConfig with nested models
     When accessing nested model fields
     Then nested models should be properly composed and accessible"""
-    from spork.data_models import FeatureNumber, FeatureRequest, WorktreeConfig
-
     # Given / When
-    config = WorktreeConfig(
-        branch_name="042-fix-bug",
-        directory_path=Path(".worktrees/042-fix-bug"),
-        base_branch="main",
-        feature_number=FeatureNumber(number=42, formatted="042"),
-        feature_request=FeatureRequest(text="fix bug", sanitized_name="fix-bug")
-    )
+    config = sample_worktree_config
 
     # Then
-    assert config.feature_number.number == 42
-    assert config.feature_number.formatted == "042"
-    assert config.feature_request.text == "fix bug"
-    assert config.feature_request.sanitized_name == "fix-bug"
-
-
-def test_worktree_config_immutable():
-    """Given created WorktreeConfig model
-    When attempting to modify fields
-    Then validation error should be raised (frozen model)"""
-    from spork.data_models import FeatureNumber, FeatureRequest, WorktreeConfig
-
-    # Given
-    config = WorktreeConfig(
-        branch_name="001-test",
-        directory_path=Path(".worktrees/001-test"),
-        base_branch="main",
-        feature_number=FeatureNumber(number=1, formatted="001"),
-        feature_request=FeatureRequest(text="test", sanitized_name="test")
-    )
-
-    # When / Then
-    with pytest.raises(ValidationError, match="frozen"):
-        config.branch_name = "002-test"  # type: ignore
+    assert config.feature_number.number == 1
+    assert config.feature_number.formatted == "001"
+    assert config.feature_request.text == "test"
+    assert config.feature_request.sanitized_name == "test"
 
 
 def test_command_context_valid():
     """Given valid command context data
     When creating CommandContext model
     Then model should be created successfully"""
-    from spork.data_models import CommandContext
-
     # Given / When
     context = CommandContext(
-        original_cwd=Path("/Users/dev/project"),
+        original_cwd=_CWD_PATH,
         repository=None,
         worktree_config=None,
         validation_results=[]
     )
 
     # Then
-    assert context.original_cwd == Path("/Users/dev/project")
+    assert os.fspath(context.original_cwd) == "/Users/dev/project"
     assert context.repository is None
     assert context.worktree_config is None
     assert context.validation_results == []
@@ -442,77 +328,62 @@ def test_command_context_optional_fields():
     """Given CommandContext with optional fields
     When creating model with some fields None
     Then model should be created successfully"""
-    from spork.data_models import CommandContext
-
     # Given / When
-    context = CommandContext(original_cwd=Path("/test"))
+    context = CommandContext(original_cwd=_TEST_PATH)
 
     # Then
     assert context.repository is None
     assert context.worktree_config is None
-    assert isinstance(context.validation_results, list)
+    assert type(context.validation_results) is list
 
 
 def test_command_context_default_factory():
     """Given CommandContext without validation_results
     When creating model
     Then validation_results should be initialized as empty list"""
-    from spork.data_models import CommandContext
-
     # Given / When
-    context = CommandContext(original_cwd=Path("/test"))
+    context = CommandContext(original_cwd=_TEST_PATH)
 
     # Then
     assert context.validation_results == []
-    assert isinstance(context.validation_results, list)
+    assert type(context.validation_results) is list
 
 
-def test_command_context_with_all_fields():
+def test_command_context_with_all_fields(
+    full_command_context, sample_git_repository, sample_worktree_config, sample_validation_result
+):
     """Given CommandContext with all fields populated
     When creating model
     Then all fields should be properly set"""
-    from spork.data_models import (
-        CommandContext,
-        FeatureNumber,
-        FeatureRequest,
-        GitRepository,
-        ValidationResult,
-        WorktreeConfig,
-    )
+    # Given / When
+    context = full_command_context
 
+    # Then
+    assert os.fspath(context.original_cwd) == "/test"
+    assert context.repository == sample_git_repository
+    assert context.worktree_config == sample_worktree_config
+    assert context.validation_results == [sample_validation_result]
+
+
+@pytest.mark.parametrize(
+    "model_fixture, field, new_value, error, match",
+    [
+        ("sample_feature_request", "text", "new text", ValidationError, _ERR_FROZEN),
+        ("sample_validation_result", "passed", False, ValidationError, _ERR_FROZEN),
+        ("sample_git_repository", "main_branch", "master", FrozenInstanceError, _ERR_FROZEN_FIELD),
+        ("sample_feature_number", "number", 2, FrozenInstanceError, _ERR_FROZEN_FIELD),
+        (
+            "sample_worktree_config", "branch_name", "002-test",
+            FrozenInstanceError, _ERR_FROZEN_FIELD,
+        ),
+    ],
+)
+def test_model_immutable(request, model_fixture, field, new_value, error, match):
+    """Given a created frozen model
+    When attempting to modify a field
+    Then should raise ValidationError (Pydantic) or FrozenInstanceError (dataclass)"""
     # Given
-    repo = GitRepository(
-        root_path=Path("/test"),
-        current_branch="main",
-        has_remote=True,
-        main_branch="main"
-    )
-    config = WorktreeConfig(
-        branch_name="001-test",
-        directory_path=Path(".worktrees/001-test"),
-        base_branch="main",
-        feature_number=FeatureNumber(number=1, formatted="001"),
-        feature_request=FeatureRequest(text="test", sanitized_name="test")
-    )
-    results = [
-        ValidationResult(
-            check_name="git_installed",
-            passed=True,
-            error_message=None,
-            suggestion=None
-        )
-    ]
+    model = request.getfixturevalue(model_fixture)
 
-    # When
-    context = CommandContext(
-        original_cwd=Path("/test"),
-        repository=repo,
-        worktree_config=config,
-        validation_results=results
-    )
-
-    # Then
-    assert context.original_cwd == Path("/test")
-    assert context.repository == repo
-    assert context.worktree_config == config
-    assert context.validation_results == results
+    # When / Then
+    _assert_raises(error, match, setattr, model, field, new_value)
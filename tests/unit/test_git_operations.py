@@ -1,26 +1,23 @@
 """Tests for git operations module.
 
-This module tests all 7 git operations with mocked subprocess calls
+This module tests all git operations with mocked subprocess calls
 using pytest-subprocess fixture.
 """
 
+import subprocess
 from pathlib import Path
 
 import pytest
 
 
-def test_is_git_installed_success(fp):
+def test_is_git_installed_success(monkeypatch):
     """Given git is installed and in PATH
     When checking if git is installed
     Then should return True"""
     from spork.git_operations import is_git_installed
 
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3 (Apple Git-145)\n"
-    )
+    monkeypatch.setattr("spork.git_operations.shutil.which", lambda cmd: "/usr/bin/git")
 
     # When
     result = is_git_installed()
@@ -29,18 +26,14 @@ def test_is_git_installed_success(fp):
     assert result is True
 
 
-def test_is_git_installed_not_found(fp):
+def test_is_git_installed_not_found(monkeypatch):
     """Given git is not installed or not in PATH
     When checking if git is installed
     Then should return False"""
     from spork.git_operations import is_git_installed
 
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=127,
-        stderr="command not found: git\n"
-    )
+    monkeypatch.setattr("spork.git_operations.shutil.which", lambda cmd: None)
 
     # When
     result = is_git_installed()
@@ -129,19 +122,192 @@ def test_get_repo_root_not_repo(fp):
         get_repo_root()
 
 
-def test_get_main_branch_uses_main(fp):
-    """Given repository has 'main' branch
-    When getting main branch name
-    Then should return 'main'"""
-    from spork.git_operations import get_main_branch
+def test_get_repo_root_cached_per_cwd(fp):
+    """Given repository root already resolved from a directory
+    When getting repository root again, then from another directory
+    Then should run git once per distinct directory"""
+    from spork.git_operations import get_repo_root
 
     # Given
     fp.register(
-        ["git", "rev-parse", "--verify", "main"],
+        ["git", "rev-parse", "--show-toplevel"],
         returncode=0,
-        stdout="a1b2c3d4e5f6\n"
+        stdout="/Users/dev/my-project\n"
+    )
+    get_repo_root("/Users/dev/my-project/src")
+
+    # When
+    get_repo_root("/Users/dev/my-project/src")
+    get_repo_root("/Users/dev/my-project/docs")
+
+    # Then
+    assert fp.call_count(["git", "rev-parse", "--show-toplevel"]) == 2
+
+
+REPO_TOPLEVEL_ARGS = ["rev-parse", "--is-inside-work-tree", "--show-toplevel"]
+REPO_REFS_ARGS = ["for-each-ref", "--format=%(refname) %(symref)", "refs/heads/", "refs/remotes/"]
+
+
+def _register_repo_info(fp, path, refs, root="/Users/dev/my-project"):
+    """Register load_repo_info's git calls for a work tree at root listing refs."""
+    fp.register(["git", "-C", str(path), *REPO_TOPLEVEL_ARGS], stdout=f"true\n{root}\n")
+    fp.register(["git", "-C", str(path), *REPO_REFS_ARGS], stdout=refs)
+
+
+def test_load_repo_info_uses_main(fp):
+    """Given repository has 'main' and 'master' branches
+    When loading repository info
+    Then should return repo root and prefer 'main'"""
+    from spork.git_operations import load_repo_info
+
+    # Given
+    test_path = Path("/Users/dev/my-project/src")
+    _register_repo_info(
+        fp,
+        test_path,
+        "refs/heads/001-add-auth \nrefs/heads/main \nrefs/heads/master \n",
+    )
+
+    # When
+    result = load_repo_info(test_path)
+
+    # Then
+    assert result is not None
+    assert (result.root, result.main_branch) == (Path("/Users/dev/my-project"), "main")
+
+
+def test_load_repo_info_uses_master(fp):
+    """Given repository has 'master' branch but no 'main'
+    When loading repository info
+    Then should return 'master' as main branch"""
+    from spork.git_operations import load_repo_info
+
+    # Given
+    test_path = Path("/Users/dev/my-project")
+    _register_repo_info(fp, test_path, "refs/heads/master \n")
+
+    # When
+    result = load_repo_info(test_path)
+
+    # Then
+    assert result is not None
+    assert (result.root, result.main_branch) == (Path("/Users/dev/my-project"), "master")
+
+
+def test_load_repo_info_no_main_branch(fp):
+    """Given repository has neither 'main' nor 'master' branch
+    When loading repository info
+    Then should return None for main branch"""
+    from spork.git_operations import load_repo_info
+
+    # Given
+    test_path = Path("/Users/dev/my-project")
+    _register_repo_info(fp, test_path, "refs/heads/develop \n")
+
+    # When
+    result = load_repo_info(test_path)
+
+    # Then
+    assert result is not None
+    assert (result.root, result.main_branch) == (Path("/Users/dev/my-project"), None)
+
+
+def test_load_repo_info_not_repo(fp):
+    """Given path is not in a git repository
+    When loading repository info
+    Then should return None"""
+    from spork.git_operations import load_repo_info
+
+    # Given
+    test_path = Path("/Users/dev/not-a-repo")
+    fp.register(
+        ["git", "-C", str(test_path), *REPO_TOPLEVEL_ARGS],
+        returncode=128,
+        stderr="fatal: not a git repository\n"
     )
 
+    # When
+    result = load_repo_info(test_path)
+
+    # Then
+    assert result is None
+
+
+def test_load_repo_info_tags_sharing_branch_names(tmp_path):
+    """Given a real repository with tags named like the 'main' and '001-add-auth' branches
+    When loading repository info
+    Then should list both branches"""
+    from spork.git_operations import load_repo_info
+
+    # Given - main and 001-add-auth, each shadowed by a tag
+    def git(*args):
+        return subprocess.run(
+            ["git", "-c", "user.name=spork", "-c", "user.email=spork@example.com", *args],
+            cwd=tmp_path, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    git("init", "-q", "-b", "main")
+    git("commit", "-q", "--allow-empty", "-m", "first")
+    git("branch", "001-add-auth")
+    git("commit", "-q", "--allow-empty", "-m", "second")
+    git("tag", "main", "refs/heads/001-add-auth")
+    git("tag", "001-add-auth", "refs/heads/main")
+
+    # When
+    result = load_repo_info(tmp_path)
+
+    # Then
+    assert result is not None
+    assert result.main_branch == "main"
+    assert result.local_branches == ("001-add-auth", "main")
+
+
+MAIN_BRANCH_REFS = [
+    "git", "for-each-ref", "--format=%(refname:short)", "refs/heads/main", "refs/heads/master"
+]
+
+
+def test_load_repo_info_collects_branches(fp):
+    """Given repository with local branches and a remote whose HEAD repeats a branch
+    When loading repository info
+    Then should return root, main branch and branch names without origin/HEAD"""
+    from spork.data_models import GitRepoInfo
+    from spork.git_operations import load_repo_info
+
+    # Given
+    test_path = Path("/Users/dev/my-project")
+    _register_repo_info(
+        fp,
+        test_path,
+        "refs/heads/001-add-auth \n"
+        "refs/heads/main \n"
+        "refs/remotes/origin/HEAD refs/remotes/origin/main\n"
+        "refs/remotes/origin/002-fix-bug \n"
+        "refs/remotes/origin/main \n",
+    )
+
+    # When
+    result = load_repo_info(test_path)
+
+    # Then
+    assert result == GitRepoInfo(
+        root=Path("/Users/dev/my-project"),
+        main_branch="main",
+        local_branches=("001-add-auth", "main"),
+        remote_branches=("origin/002-fix-bug", "origin/main"),
+    )
+    assert result.branches == ["001-add-auth", "main", "origin/002-fix-bug", "origin/main"]
+
+
+def test_get_main_branch_uses_main(fp):
+    """Given repository has 'main' and 'master' branches
+    When getting main branch name
+    Then should prefer 'main'"""
+    from spork.git_operations import get_main_branch
+
+    # Given
+    fp.register(MAIN_BRANCH_REFS, returncode=0, stdout="main\nmaster\n")
+
     # When
     result = get_main_branch()
 
@@ -152,26 +318,18 @@ def test_get_main_branch_uses_main(fp):
 def test_get_main_branch_uses_master(fp):
     """Given repository has 'master' branch but no 'main'
     When getting main branch name
-    Then should return 'master'"""
+    Then should return 'master' from a single git call"""
     from spork.git_operations import get_main_branch
 
     # Given
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=128,
-        stderr="fatal: Needed a single revision\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "master"],
-        returncode=0,
-        stdout="a1b2c3d4e5f6\n"
-    )
+    fp.register(MAIN_BRANCH_REFS, returncode=0, stdout="master\n")
 
     # When
     result = get_main_branch()
 
     # Then
     assert result == "master"
+    assert fp.call_count(MAIN_BRANCH_REFS) == 1
 
 
 def test_get_main_branch_neither_exists(fp):
@@ -181,22 +339,31 @@ def test_get_main_branch_neither_exists(fp):
     from spork.git_operations import get_main_branch
 
     # Given
-    fp.register(
-        ["git", "rev-parse", "--verify", "main"],
-        returncode=128,
-        stderr="fatal: Needed a single revision\n"
-    )
-    fp.register(
-        ["git", "rev-parse", "--verify", "master"],
-        returncode=128,
-        stderr="fatal: Needed a single revision\n"
-    )
+    fp.register(MAIN_BRANCH_REFS, returncode=0, stdout="")
 
     # When / Then
     with pytest.raises(RuntimeError, match="neither 'main' nor 'master' branch found"):
         get_main_branch()
 
 
+def test_get_main_branch_cached_per_cwd(fp):
+    """Given main branch already resolved from a directory
+    When getting main branch again, then from another directory
+    Then should run git once per distinct directory"""
+    from spork.git_operations import get_main_branch
+
+    # Given
+    fp.register(MAIN_BRANCH_REFS, returncode=0, stdout="main\n")
+    get_main_branch("/Users/dev/my-project")
+
+    # When
+    get_main_branch("/Users/dev/my-project")
+    get_main_branch("/Users/dev/other-project")
+
+    # Then
+    assert fp.call_count(MAIN_BRANCH_REFS) == 2
+
+
 def test_git_fetch_success(fp):
     """Given git fetch can connect to remote
     When running git fetch
@@ -205,7 +372,7 @@ def test_git_fetch_success(fp):
 
     # Given
     fp.register(
-        ["git", "fetch"],
+        ["git", "fetch", "--quiet"],
         returncode=0,
         stdout="From github.com:user/repo\n   a1b2c3d..e4f5g6h  main -> origin/main\n"
     )
@@ -225,7 +392,7 @@ def test_git_fetch_network_error(fp):
 
     # Given
     fp.register(
-        ["git", "fetch"],
+        ["git", "fetch", "--quiet"],
         returncode=1,
         stderr="fatal: unable to access 'https://...': Could not resolve host\n"
     )
@@ -237,6 +404,28 @@ def test_git_fetch_network_error(fp):
     assert result is False
 
 
+def test_cancel_git_fetch_kills_after_grace_period():
+    """Given a fetch that ignores SIGTERM
+    When cancelling it
+    Then should terminate first and kill only once the grace period runs out"""
+    from unittest.mock import Mock
+
+    from spork.git_operations import cancel_git_fetch
+
+    # Given
+    process = Mock(args=["git", "fetch", "--quiet"])
+    process.poll.return_value = None
+    process.wait.side_effect = [subprocess.TimeoutExpired(process.args, 1), -9]
+
+    # When
+    cancel_git_fetch(process, grace=1)
+
+    # Then
+    process.terminate.assert_called_once_with()
+    process.kill.assert_called_once_with()
+    assert process.wait.call_count == 2
+
+
 def test_list_all_branches_success(fp):
     """Given repository has local and remote branches
     When listing all branches
@@ -245,7 +434,7 @@ def test_list_all_branches_success(fp):
 
     # Given
     fp.register(
-        ["git", "branch", "-a", "--format=%(refname:short)"],
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/", "refs/remotes/"],
         returncode=0,
         stdout="main\n001-add-auth\n002-fix-bug\norigin/main\norigin/001-add-auth\n"
     )
@@ -265,7 +454,7 @@ def test_list_all_branches_includes_remote(fp):
 
     # Given
     fp.register(
-        ["git", "branch", "-a", "--format=%(refname:short)"],
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/", "refs/remotes/"],
         returncode=0,
         stdout="main\norigin/main\norigin/003-new-feature\n"
     )
@@ -278,6 +467,49 @@ def test_list_all_branches_includes_remote(fp):
     assert "origin/003-new-feature" in result
 
 
+def test_list_all_branches_git_error(fp):
+    """Given git for-each-ref fails
+    When listing all branches
+    Then should return empty list"""
+    from spork.git_operations import list_all_branches
+
+    # Given
+    fp.register(
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/", "refs/remotes/"],
+        returncode=128,
+        stderr="fatal: not a git repository\n"
+    )
+
+    # When
+    result = list_all_branches()
+
+    # Then
+    assert result == []
+
+
+def test_list_all_branches_timeout(fp):
+    """Given git for-each-ref prints a branch and then hangs
+    When listing all branches
+    Then should give up after the timeout and return empty list"""
+    from spork.git_operations import list_all_branches
+
+    # Given - the process outlives the timeout while reading its output
+    def hang(process):
+        raise subprocess.TimeoutExpired(process.args, 5)
+
+    fp.register(
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/", "refs/remotes/"],
+        stdout="main\n",
+        callback=hang
+    )
+
+    # When
+    result = list_all_branches()
+
+    # Then
+    assert result == []
+
+
 def test_create_worktree_success(fp):
     """Given valid worktree parameters
     When creating worktree
@@ -347,3 +579,25 @@ def test_create_worktree_permission_denied(fp):
     # When / Then
     with pytest.raises(RuntimeError, match="Permission denied"):
         create_worktree(path, branch_name, base_branch)
+
+
+def test_create_worktree_invalid_base_branch(fp):
+    """Given a base branch that does not exist
+    When creating worktree
+    Then should raise RuntimeError naming the base branch as invalid"""
+    from spork.git_operations import create_worktree
+
+    # Given
+    path = Path(".worktrees/001-add-auth")
+    branch_name = "001-add-auth"
+    base_branch = "mian"
+
+    fp.register(
+        ["git", "worktree", "add", str(path), "-b", branch_name, base_branch],
+        returncode=128,
+        stderr=f"fatal: invalid reference: {base_branch}\n"
+    )
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Invalid base branch"):
+        create_worktree(path, branch_name, base_branch)
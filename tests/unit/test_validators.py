@@ -3,231 +3,242 @@
 This module tests all validation functions for prerequisites.
 """
 
+from types import SimpleNamespace
 
+import pytest
 
+from spork.validators import (
+    _check_gitignore,
+    is_claude_code_installed,
+    is_git_installed,
+    is_spec_kit_initialized,
+)
 
-def test_is_git_installed_validator_success(fp):
-    """Given git is installed
+
+def _assert_validation(result, check_name, passed, *error_parts):
+    """Assert result's check name and outcome.
+
+    A passing result must carry no error message. A failing one must have a
+    suggestion and an error message containing each of error_parts (any case).
+    """
+    assert result.check_name == check_name
+    assert result.passed is passed
+    if passed:
+        assert result.error_message is None
+    else:
+        message = result.error_message.lower()
+        for part in error_parts:
+            assert part in message
+        assert result.suggestion is not None
+
+
+def _stub_cat_file(monkeypatch, stdout):
+    """Stub the validators' git runner to answer ``git cat-file --batch-check`` with stdout."""
+    def run(args, cwd, input):
+        assert args == ["git", "cat-file", "--batch-check"]
+        return SimpleNamespace(returncode=0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr("spork.validators._run", run)
+
+
+@pytest.fixture
+def gitignore(spec_kit_dir):
+    """Provide the .gitignore path in spec_kit_dir, removing the file afterwards."""
+    path = spec_kit_dir / ".gitignore"
+    yield path
+    path.unlink(missing_ok=True)
+
+
+def test_is_git_installed_validator_success(monkeypatch):
+    """Given git is installed and in PATH
     When running validator
     Then should return ValidationResult with passed=True"""
-    from spork.validators import is_git_installed
-
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=0,
-        stdout="git version 2.39.3\n"
-    )
+    monkeypatch.setattr("spork.validators.shutil.which", lambda cmd: "/usr/bin/git")
 
     # When
     result = is_git_installed()
 
     # Then
-    assert result.passed is True
-    assert result.check_name == "git_installed"
-    assert result.error_message is None
+    _assert_validation(result, "git_installed", True)
 
 
-def test_is_git_installed_validator_failure(fp):
-    """Given git is not installed
+def test_is_git_installed_validator_failure(monkeypatch):
+    """Given git is not in PATH
     When running validator
     Then should return ValidationResult with passed=False and error message"""
-    from spork.validators import is_git_installed
-
     # Given
-    fp.register(
-        ["git", "--version"],
-        returncode=127,
-        stderr="command not found: git\n"
-    )
+    monkeypatch.setattr("spork.validators.shutil.which", lambda cmd: None)
 
     # When
     result = is_git_installed()
 
     # Then
-    assert result.passed is False
-    assert result.check_name == "git_installed"
-    assert "not installed" in result.error_message.lower()
-    assert result.suggestion is not None
+    _assert_validation(result, "git_installed", False, "not installed")
+
+
+@pytest.mark.parametrize(
+    "content,ignored",
+    [
+        pytest.param("node_modules/\n.specify/\n*.pyc\n", True, id="directory"),
+        pytest.param(".specify\n", True, id="bare_name"),
+        pytest.param("  .specify/memory/  \n", True, id="subpath_with_whitespace"),
+        pytest.param("", False, id="empty"),
+        pytest.param("# .specify/\n.specify-backup/\ndocs/.specify/\n", False, id="similar"),
+    ],
+)
+def test_check_gitignore_detects_specify(content, ignored):
+    """Given .gitignore content
+    When checking it for Spec Kit entries
+    Then should fail only if an entry excludes .specify/"""
+    # When
+    result = _check_gitignore(content)
+
+    # Then
+    if ignored:
+        assert result.passed is False
+        assert "gitignore" in result.error_message.lower()
+    else:
+        assert result is None
 
 
-def test_is_spec_kit_initialized_in_gitignore(tmp_path, fp):
+def test_is_spec_kit_initialized_in_gitignore(spec_kit_dir, gitignore):
     """Given .specify/ is listed in .gitignore
     When running validator
     Then should return ValidationResult with passed=False"""
-    from spork.validators import is_spec_kit_initialized
-
     # Given - Create .gitignore with .specify/ entry
-    gitignore = tmp_path / ".gitignore"
     gitignore.write_text("node_modules/\n.specify/\n*.pyc\n")
 
     # When
-    result = is_spec_kit_initialized(tmp_path, "main")
+    result = is_spec_kit_initialized(spec_kit_dir, "main")
 
     # Then
-    assert result.passed is False
-    assert result.check_name == "spec_kit_on_main"
-    assert ".specify/" in result.error_message
-    assert "gitignore" in result.error_message.lower()
+    _assert_validation(result, "spec_kit_on_main", False, ".specify/", "gitignore")
     assert "remove" in result.suggestion.lower()
 
 
-def test_is_spec_kit_initialized_success(tmp_path, fp):
+def test_is_spec_kit_initialized_gitignore_similar_entries(spec_kit_dir, gitignore, monkeypatch):
+    """Given .gitignore only has entries resembling .specify/
+    When running validator
+    Then should not report Spec Kit as ignored"""
+    # Given
+    gitignore.write_text("# .specify/\n.specify-backup/\ndocs/.specify/\n")
+    _stub_cat_file(
+        monkeypatch,
+        "main:.specify/memory/constitution.md missing\n"
+        "main:.specify/templates missing\n"
+        "main:.specify/scripts missing\n"
+    )
+
+    # When
+    result = is_spec_kit_initialized(spec_kit_dir, "main")
+
+    # Then
+    assert result.passed is False
+    assert "gitignore" not in result.error_message.lower()
+
+
+def test_is_spec_kit_initialized_success(spec_kit_dir, monkeypatch):
     """Given Spec Kit is properly initialized on main branch
     When running validator
     Then should return ValidationResult with passed=True"""
-    from spork.validators import is_spec_kit_initialized
-
-    # Given - Mock git show commands to succeed
-    fp.register(
-        ["git", "show", "main:.specify/memory/constitution.md"],
-        stdout="# Constitution",
-        returncode=0
-    )
-    fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/templates/"],
-        stdout="040000 tree abc123\t.specify/templates",
-        returncode=0
-    )
-    fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/scripts/"],
-        stdout="040000 tree def456\t.specify/scripts",
-        returncode=0
+    # Given - Mock git cat-file to report the full Spec Kit layout
+    _stub_cat_file(
+        monkeypatch,
+        "3f2a1b4c blob 512\n"
+        "8d9e0f1a tree 64\n"
+        "2b3c4d5e tree 48\n"
     )
 
     # When
-    result = is_spec_kit_initialized(tmp_path, "main")
+    result = is_spec_kit_initialized(spec_kit_dir, "main")
 
     # Then
-    assert result.passed is True
-    assert result.check_name == "spec_kit_on_main"
-    assert result.error_message is None
+    _assert_validation(result, "spec_kit_on_main", True)
 
 
-def test_is_spec_kit_initialized_missing_on_main(tmp_path, fp):
+def test_is_spec_kit_initialized_missing_on_main(spec_kit_dir, monkeypatch):
     """Given Spec Kit does not exist on main branch
     When running validator
     Then should return ValidationResult with passed=False"""
-    from spork.validators import is_spec_kit_initialized
-
-    # Given - git show fails (file doesn't exist on main)
-    fp.register(
-        ["git", "show", "main:.specify/memory/constitution.md"],
-        returncode=128,
-        stderr="fatal: path '.specify/memory/constitution.md' does not exist"
+    # Given - git cat-file finds none of .specify/ on main
+    _stub_cat_file(
+        monkeypatch,
+        "main:.specify/memory/constitution.md missing\n"
+        "main:.specify/templates missing\n"
+        "main:.specify/scripts missing\n"
     )
 
     # When
-    result = is_spec_kit_initialized(tmp_path, "main")
+    result = is_spec_kit_initialized(spec_kit_dir, "main")
 
     # Then
-    assert result.passed is False
-    assert result.check_name == "spec_kit_on_main"
-    assert "not found on main" in result.error_message.lower()
+    _assert_validation(result, "spec_kit_on_main", False, "not found on main")
     assert "main branch" in result.suggestion.lower()
 
 
-def test_is_spec_kit_initialized_missing_templates_on_main(tmp_path, fp):
+def test_is_spec_kit_initialized_missing_templates_on_main(spec_kit_dir, monkeypatch):
     """Given .specify exists but templates directory is missing on main branch
     When running validator
     Then should return ValidationResult with passed=False"""
-    from spork.validators import is_spec_kit_initialized
-
     # Given
-    fp.register(
-        ["git", "show", "main:.specify/memory/constitution.md"],
-        stdout="# Constitution",
-        returncode=0
-    )
-    fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/templates/"],
-        stdout="",  # Empty output means directory doesn't exist
-        returncode=0
+    _stub_cat_file(
+        monkeypatch,
+        "3f2a1b4c blob 512\n"
+        "main:.specify/templates missing\n"
+        "2b3c4d5e tree 48\n"
     )
 
     # When
-    result = is_spec_kit_initialized(tmp_path, "main")
+    result = is_spec_kit_initialized(spec_kit_dir, "main")
 
     # Then
-    assert result.passed is False
-    assert result.check_name == "spec_kit_on_main"
-    assert "incomplete" in result.error_message.lower()
-    assert "templates" in result.error_message.lower()
+    _assert_validation(result, "spec_kit_on_main", False, "incomplete", "templates")
 
 
-def test_is_spec_kit_initialized_missing_scripts_on_main(tmp_path, fp):
+def test_is_spec_kit_initialized_missing_scripts_on_main(spec_kit_dir, monkeypatch):
     """Given .specify exists but scripts directory is missing on main branch
     When running validator
     Then should return ValidationResult with passed=False"""
-    from spork.validators import is_spec_kit_initialized
-
     # Given
-    fp.register(
-        ["git", "show", "main:.specify/memory/constitution.md"],
-        stdout="# Constitution",
-        returncode=0
-    )
-    fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/templates/"],
-        stdout="040000 tree abc123\t.specify/templates",
-        returncode=0
-    )
-    fp.register(
-        ["git", "ls-tree", "-d", "main:.specify/scripts/"],
-        stdout="",  # Empty output means directory doesn't exist
-        returncode=0
+    _stub_cat_file(
+        monkeypatch,
+        "3f2a1b4c blob 512\n"
+        "8d9e0f1a tree 64\n"
+        "main:.specify/scripts missing\n"
     )
 
     # When
-    result = is_spec_kit_initialized(tmp_path, "main")
+    result = is_spec_kit_initialized(spec_kit_dir, "main")
 
     # Then
-    assert result.passed is False
-    assert result.check_name == "spec_kit_on_main"
-    assert "incomplete" in result.error_message.lower()
-    assert "scripts" in result.error_message.lower()
+    _assert_validation(result, "spec_kit_on_main", False, "incomplete", "scripts")
 
 
-def test_is_claude_code_installed_success(fp):
+def test_is_claude_code_installed_success(monkeypatch):
     """Given Claude Code is installed
     When running validator
     Then should return ValidationResult with passed=True"""
-    from spork.validators import is_claude_code_installed
-
     # Given
-    fp.register(
-        ["claude", "--version"],
-        returncode=0,
-        stdout="claude version 1.0.0\n"
-    )
+    monkeypatch.setattr("spork.validators.shutil.which", lambda cmd: "/usr/local/bin/claude")
 
     # When
     result = is_claude_code_installed()
 
     # Then
-    assert result.passed is True
-    assert result.check_name == "claude_code_installed"
-    assert result.error_message is None
+    _assert_validation(result, "claude_code_installed", True)
 
 
-def test_is_claude_code_installed_failure(fp):
+def test_is_claude_code_installed_failure(monkeypatch):
     """Given Claude Code is not installed
     When running validator
     Then should return ValidationResult with passed=False and error message"""
-    from spork.validators import is_claude_code_installed
-
     # Given
-    fp.register(
-        ["claude", "--version"],
-        returncode=127,
-        stderr="command not found: claude\n"
-    )
+    monkeypatch.setattr("spork.validators.shutil.which", lambda cmd: None)
 
     # When
     result = is_claude_code_installed()
 
     # Then
-    assert result.passed is False
-    assert result.check_name == "claude_code_installed"
-    assert "claude" in result.error_message.lower()
-    assert result.suggestion is not None
+    _assert_validation(result, "claude_code_installed", False, "claude")
+